@@ -18,15 +18,16 @@ Flow:
      server and inject their contents into Claude's system prompt.
 """
 
+import json
 import os
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import BaseModel
 
 from mcp import ClientSession, StdioServerParameters
@@ -36,6 +37,7 @@ load_dotenv()
 
 HERE = Path(__file__).parent
 SERVER = HERE / "mcp_server.py"
+INDEX_HTML = (HERE / "index.html").read_text()
 
 state: dict = {}
 
@@ -49,10 +51,14 @@ async def lifespan(app: FastAPI):
             state["session"] = session
             print("MCP session ready.", file=sys.stderr)
             yield
+    # Release the Anthropic client's pooled connections on shutdown.
+    await anthropic.close()
 
 
 app = FastAPI(lifespan=lifespan)
-anthropic = Anthropic()
+# Async client: /chat is an async endpoint, and a blocking messages.create()
+# would stall the event loop (and every other request) for the whole reply.
+anthropic = AsyncAnthropic()
 
 
 class ChatRequest(BaseModel):
@@ -98,18 +104,32 @@ async def chat(req: ChatRequest):
             "resources, so you have no Acme context — say so."
         )
 
-    resp = anthropic.messages.create(
-        model="claude-sonnet-5",
-        max_tokens=1024,
-        system=system,
-        messages=[{"role": "user", "content": req.message}],
-    )
-    return {"reply": resp.content[0].text, "system_preview": system[:400]}
+    # Stream the reply as Server-Sent Events so the UI can render tokens as
+    # they arrive instead of waiting for the whole completion.
+    async def events():
+        try:
+            async with anthropic.messages.stream(
+                model="claude-sonnet-5",
+                max_tokens=1024,
+                # The resource block is identical for every question asked
+                # against the same selection, so mark it cacheable: follow-ups
+                # read it from the prompt cache instead of re-processing it.
+                # (Prompts shorter than the model's minimum cacheable length
+                # are simply not cached.)
+                system=[{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+                messages=[{"role": "user", "content": req.message}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield f"data: {json.dumps({'delta': text})}\n\n"
+        except Exception as exc:  # surface API errors in the chat log
+            yield f"data: {json.dumps({'error': str(exc)})}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
 
 
 @app.get("/")
 async def root():
-    return HTMLResponse((HERE / "index.html").read_text())
+    return HTMLResponse(INDEX_HTML)
 
 
 if __name__ == "__main__":
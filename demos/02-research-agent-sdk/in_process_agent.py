@@ -54,7 +54,9 @@ WORKSPACE.mkdir(exist_ok=True)
 
 @tool("web_search", "Search the web. Returns JSON [{title, url, snippet}].", {"query": str})
 async def web_search(args: dict[str, Any]) -> dict[str, Any]:
-    hits = DDGS().text(args["query"], max_results=5)
+    # DDGS is synchronous; run it on a worker thread so this in-process tool
+    # doesn't freeze the agent's event loop for the whole search.
+    hits = await asyncio.to_thread(DDGS().text, args["query"], max_results=5)
     results = [
         {"title": h.get("title"), "url": h.get("href"), "snippet": h.get("body")}
         for h in hits
@@ -67,7 +69,7 @@ async def save_brief(args: dict[str, Any]) -> dict[str, Any]:
     p = (WORKSPACE / args["filename"]).resolve()
     if WORKSPACE not in p.parents:
         return {"content": [{"type": "text", "text": "Error: path escapes workspace"}], "is_error": True}
-    p.write_text(args["content"])
+    await asyncio.to_thread(p.write_text, args["content"])  # keep the loop free
     return {"content": [{"type": "text", "text": f"Saved {args['filename']}"}]}
 
 
@@ -30,6 +30,7 @@ import asyncio
 import logging
 import os
 import sys
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -88,6 +89,27 @@ ALLOWED_TOOLS = {
 # --- Hooks -----------------------------------------------------------------
 
 
+def _check_topic(tool_input: dict) -> str | None:
+    if len((tool_input.get("topic") or "").strip()) < 3:
+        return "Topic must be at least 3 chars"
+    return None
+
+
+def _check_brief_path(tool_input: dict) -> str | None:
+    path = tool_input.get("brief_path", "")
+    if ".." in path or path.startswith("/"):
+        return "Path must be relative, under briefs/"
+    return None
+
+
+# Tool name -> validator returning a denial reason, or None to allow. One
+# dict lookup per call; tools without an entry pass straight through.
+PRE_TOOL_VALIDATORS = {
+    "mcp__research__research_topic": _check_topic,
+    "mcp__research__read_brief": _check_brief_path,
+}
+
+
 async def pre_tool_validate(input_data: dict, tool_use_id: str | None, context: HookContext) -> dict:
     """PreToolUse: cheap input validation before the tool runs.
 
@@ -95,32 +117,21 @@ async def pre_tool_validate(input_data: dict, tool_use_id: str | None, context:
     spend a network round-trip or hit the LLM context with an error result.
     """
     tool_name = input_data.get("tool_name", "")
+    validator = PRE_TOOL_VALIDATORS.get(tool_name)
+    if validator is None:
+        return {}
     tool_input = input_data.get("tool_input", {})
-
-    if tool_name == "mcp__research__research_topic":
-        topic = (tool_input.get("topic") or "").strip()
-        if len(topic) < 3:
-            log.warning("blocked: empty/too-short topic")
-            return {
-                "hookSpecificOutput": {
-                    "hookEventName": "PreToolUse",
-                    "permissionDecision": "deny",
-                    "permissionDecisionReason": "Topic must be at least 3 chars",
-                },
-            }
-
-    if tool_name == "mcp__research__read_brief":
-        path = tool_input.get("brief_path", "")
-        if ".." in path or path.startswith("/"):
-            log.warning("blocked: suspicious brief_path %r", path)
-            return {
-                "hookSpecificOutput": {
-                    "hookEventName": "PreToolUse",
-                    "permissionDecision": "deny",
-                    "permissionDecisionReason": "Path must be relative, under briefs/",
-                },
-            }
-    return {}
+    reason = validator(tool_input)
+    if reason is None:
+        return {}
+    log.warning("blocked %s: %s (input=%r)", tool_name, reason, tool_input)
+    return {
+        "hookSpecificOutput": {
+            "hookEventName": "PreToolUse",
+            "permissionDecision": "deny",
+            "permissionDecisionReason": reason,
+        },
+    }
 
 
 async def post_tool_log(input_data: dict, tool_use_id: str | None, context: HookContext) -> dict:
@@ -178,9 +189,7 @@ class ExecutionTracker:
 
     def print_summary(self) -> None:
         dur = (self.ended - self.started).total_seconds() if self.ended else 0.0
-        counts: dict[str, int] = {}
-        for c in self.tool_calls:
-            counts[c["name"]] = counts.get(c["name"], 0) + 1
+        counts = Counter(c["name"] for c in self.tool_calls)
         print("\n" + "─" * 60)
         print(f"status: {self.status}   duration: {dur:.2f}s   cost (est): ${self.cost_usd:.4f}")
         for name, n in counts.items():
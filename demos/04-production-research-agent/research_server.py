@@ -47,7 +47,11 @@ import json
 import logging
 import os
 import re
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urlparse
@@ -61,9 +65,8 @@ logger = logging.getLogger("research-server")
 # --- Configuration ---------------------------------------------------------
 
 WORKSPACE = (Path(__file__).parent / "workspace").resolve()
-WORKSPACE.mkdir(exist_ok=True)
 BRIEFS_DIR = WORKSPACE / "briefs"
-BRIEFS_DIR.mkdir(exist_ok=True)
+BRIEFS_DIR.mkdir(parents=True, exist_ok=True)  # creates WORKSPACE too
 
 # In production this would be OAuth/CIMD. For a live demo a shared bearer
 # token keeps the auth wiring visible without 100 lines of OAuth code.
@@ -111,6 +114,35 @@ def _search(query: str, max_results: int) -> list[dict]:
 
 ALLOWED_FETCH_SCHEMES = {"http", "https"}
 
+# One pooled client for every page fetch. research_topic pulls several sources
+# per call, and reusing keep-alive connections skips a TCP/TLS handshake each
+# time instead of paying it per URL.
+_HTTP = httpx.Client(
+    timeout=10,
+    follow_redirects=True,
+    headers={"User-Agent": "mcp-course-research/1.0"},
+)
+
+# Max pages research_topic fetches in parallel for one call.
+FETCH_CONCURRENCY = 8
+
+# Raw-HTML budget per page. Markup and inline scripts outweigh visible text
+# many times over, so this leaves ample room for a 4000-char excerpt.
+MAX_FETCH_BYTES = 256 * 1024
+
+# Small LRU of recent extractions, keyed by (url, max_chars). Related topics
+# keep surfacing the same popular pages; a hit skips the download and parse.
+FETCH_CACHE_SIZE = 256
+FETCH_CACHE_TTL = 300  # seconds
+_FETCH_CACHE: OrderedDict[tuple[str, int], tuple[float, str]] = OrderedDict()
+_FETCH_CACHE_LOCK = threading.Lock()
+
+# Compiled once at import: _fetch_page runs per source on every research call.
+# Script and style blocks are dropped in one pass over the page.
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
 
 def _fetch_page(url: str, max_chars: int = 4000) -> str:
     """Fetch a URL and return a stripped-text excerpt.
@@ -122,23 +154,55 @@ def _fetch_page(url: str, max_chars: int = 4000) -> str:
     """
     if urlparse(url).scheme not in ALLOWED_FETCH_SCHEMES:
         return ""
+    key = (url, max_chars)
+    now = time.monotonic()
+    with _FETCH_CACHE_LOCK:
+        cached = _FETCH_CACHE.get(key)
+        if cached and now - cached[0] < FETCH_CACHE_TTL:
+            _FETCH_CACHE.move_to_end(key)
+            return cached[1]
     try:
-        resp = httpx.get(
-            url,
-            timeout=10,
-            follow_redirects=True,
-            headers={"User-Agent": "mcp-course-research/1.0"},
-        )
-        resp.raise_for_status()
+        # Stream the body and stop once we hold enough raw HTML: we only keep
+        # max_chars of text, so there's no point downloading a 5 MB page.
+        with _HTTP.stream("GET", url) as resp:
+            resp.raise_for_status()
+            buf = bytearray()
+            for chunk in resp.iter_bytes():
+                buf += chunk
+                if len(buf) >= MAX_FETCH_BYTES:
+                    break
+            html = bytes(buf[:MAX_FETCH_BYTES]).decode(resp.encoding or "utf-8", errors="replace")
     except Exception as exc:  # noqa: BLE001
         logger.info("fetch failed for %s: %r", url, exc)
         return f"(fetch failed: {exc})"
 
-    text = re.sub(r"<script\b.*?</script>", " ", resp.text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<style\b.*?</style>", " ", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text[:max_chars]
+    text = _SCRIPT_STYLE_RE.sub(" ", html)
+    text = _TAG_RE.sub(" ", text)
+    text = _WS_RE.sub(" ", text).strip()[:max_chars]
+    # Only successful extractions are cached; a failed fetch is retried.
+    with _FETCH_CACHE_LOCK:
+        _FETCH_CACHE[key] = (now, text)
+        _FETCH_CACHE.move_to_end(key)
+        while len(_FETCH_CACHE) > FETCH_CACHE_SIZE:
+            _FETCH_CACHE.popitem(last=False)
+    return text
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write via a hidden temp file + os.replace.
+
+    Readers (read_brief, the briefs index) see either the old brief or the
+    new one — never a half-written file if the server dies mid-write.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; keep briefs world-readable
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
 
 def _format_brief(topic: str, hits: list[dict]) -> str:
@@ -183,14 +247,18 @@ def research_topic(topic: str, max_sources: int = 5) -> dict:
 
     # Fetch + extract real text from each source so the brief is a
     # synthesis, not a link dump. Best-effort: a failed fetch leaves
-    # the entry with its snippet only.
-    for hit in hits:
-        url = hit.get("url") or ""
-        hit["excerpt"] = _fetch_page(url) if url else ""
+    # the entry with its snippet only. Pages are fetched concurrently, so
+    # the tool waits for the slowest source rather than the sum of all.
+    urls = [hit.get("url") or "" for hit in hits]
+    with ThreadPoolExecutor(max_workers=min(len(urls), FETCH_CONCURRENCY)) as pool:
+        excerpts = pool.map(lambda url: _fetch_page(url) if url else "", urls)
+        for hit, excerpt in zip(hits, excerpts):
+            hit["excerpt"] = excerpt
 
     brief = _format_brief(topic, hits)
     filename = f"{_slugify(topic)}.md"
-    (BRIEFS_DIR / filename).write_text(brief)
+    _write_atomic(BRIEFS_DIR / filename, brief)
+    _invalidate_briefs_index()
 
     return {
         "ok": True,
@@ -205,12 +273,18 @@ def research_topic(topic: str, max_sources: int = 5) -> dict:
 def list_briefs() -> dict:
     """List previously saved briefs (filename + modified time)."""
     entries = []
-    for p in sorted(BRIEFS_DIR.glob("*.md")):
-        entries.append({
-            "path": f"briefs/{p.name}",
-            "modified": datetime.fromtimestamp(p.stat().st_mtime, timezone.utc).isoformat(),
-            "size_bytes": p.stat().st_size,
-        })
+    # scandir gives names and file types from one directory read; each brief
+    # then costs a single stat() instead of one per field.
+    with os.scandir(BRIEFS_DIR) as it:
+        for e in sorted(it, key=lambda e: e.name):
+            if e.name.startswith(".") or not e.name.endswith(".md") or not e.is_file():
+                continue
+            st = e.stat()
+            entries.append({
+                "path": f"briefs/{e.name}",
+                "modified": datetime.fromtimestamp(st.st_mtime, timezone.utc).isoformat(),
+                "size_bytes": st.st_size,
+            })
     return {"ok": True, "count": len(entries), "briefs": entries}
 
 
@@ -220,15 +294,31 @@ def read_brief(brief_path: str) -> dict:
     p = (WORKSPACE / brief_path).resolve()
     if BRIEFS_DIR not in p.parents:
         return {"ok": False, "error": "path_outside_briefs"}
-    if not p.exists():
+    try:
+        return {"ok": True, "path": brief_path, "content": p.read_text()}
+    except FileNotFoundError:
         return {"ok": False, "error": "not_found", "path": brief_path}
-    return {"ok": True, "path": brief_path, "content": p.read_text()}
+
+
+# Serialized index, reused until a brief is written or the directory changes
+# (its mtime moves when files are added, removed or renamed outside the tool).
+_briefs_index_version = 0
+_briefs_index_cache: tuple[tuple[int, int], str] | None = None
+
+
+def _invalidate_briefs_index() -> None:
+    global _briefs_index_version
+    _briefs_index_version += 1
 
 
 @mcp.resource("research://briefs")
 def briefs_index() -> str:
     """A live index of all saved briefs — useful for the agent at startup."""
-    return json.dumps(list_briefs(), indent=2)
+    global _briefs_index_cache
+    key = (_briefs_index_version, BRIEFS_DIR.stat().st_mtime_ns)
+    if _briefs_index_cache is None or _briefs_index_cache[0] != key:
+        _briefs_index_cache = (key, json.dumps(list_briefs(), indent=2))
+    return _briefs_index_cache[1]
 
 
 # --- Entry point -----------------------------------------------------------
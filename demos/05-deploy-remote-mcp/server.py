@@ -75,6 +75,7 @@ mcp = FastMCP(
 
 APP_RESOURCE_URI = "ui://research-explorer/app.html"
 APP_HTML_PATH = Path(__file__).parent / "app.html"
+APP_HTML = APP_HTML_PATH.read_text()
 
 
 def _search(query: str, max_results: int = 6) -> list[dict]:
@@ -118,7 +119,7 @@ def quick_search(query: str, max_results: int = 5) -> dict:
 @mcp.resource(APP_RESOURCE_URI, mime_type="text/html;profile=mcp-app")
 def research_explorer_app() -> str:
     """The MCP App page for research_explorer (self-contained HTML)."""
-    return APP_HTML_PATH.read_text()
+    return APP_HTML
 
 
 # ---------------------------------------------------------------------------
@@ -130,6 +131,12 @@ def build_app():
     """Build the ASGI app (used by uvicorn locally AND by Vercel)."""
     app = mcp.streamable_http_app()
 
+    # json_response=True means every reply is one plain JSON body — including
+    # the MCP App's HTML resource — so it compresses well over the wire.
+    from starlette.middleware.gzip import GZipMiddleware
+
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     token = os.environ.get("MCP_AUTH_TOKEN")
     if token:
         from starlette.middleware.base import BaseHTTPMiddleware
@@ -35,6 +35,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
 from pathlib import Path
 
 import anthropic
@@ -79,15 +80,23 @@ SENSITIVE_PATH_MARKERS = (
     ".env", "id_rsa", ".ssh", "mcp.json", ".cursor",
 )
 
+# Each marker list compiled into one case-insensitive alternation, so a check
+# is a single regex search instead of lowercasing + one scan per marker.
+_SUSPICIOUS_DESCRIPTION_RE = re.compile(
+    "|".join(map(re.escape, SUSPICIOUS_DESCRIPTION_MARKERS)), re.IGNORECASE
+)
+_SENSITIVE_PATH_RE = re.compile(
+    "|".join(map(re.escape, SENSITIVE_PATH_MARKERS)), re.IGNORECASE
+)
+
 
 def pretool_guard(name: str, args: dict) -> str | None:
     """Return a denial reason to block the call, or None to allow it."""
     if name == "read_file":
         path = str(args.get("path", ""))
-        lowered = path.lower()
         outside = path.startswith("/") or ".." in path
         hidden = "/." in path or path.startswith(".")
-        sensitive = any(m in lowered for m in SENSITIVE_PATH_MARKERS)
+        sensitive = _SENSITIVE_PATH_RE.search(path) is not None
         if outside or hidden or sensitive:
             return f"read of {path!r} denied: outside the allowed workspace scope"
 
@@ -114,7 +123,7 @@ def audit_descriptions() -> None:
         name, desc = spec["name"], spec["description"]
         digest = hashlib.sha256(desc.encode()).hexdigest()[:12]
         new[name] = digest
-        if any(m in desc.lower() for m in SUSPICIOUS_DESCRIPTION_MARKERS):
+        if _SUSPICIOUS_DESCRIPTION_RE.search(desc):
             print(f"  ⚠ {name}: description contains a suspicious marker "
                   f"(possible tool poisoning). sha256={digest}")
         else:
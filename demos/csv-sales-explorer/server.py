@@ -30,6 +30,7 @@ from __future__ import annotations
 
 import csv
 import sys
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from pathlib import Path
 
@@ -55,11 +56,16 @@ mcp = FastMCP(
 CSV_PATH = Path(__file__).parent / "data" / "sales_data.csv"
 APP_RESOURCE_URI = "ui://csv-sales-explorer/app.html"
 APP_HTML_PATH = Path(__file__).parent / "app.html"
+APP_HTML = APP_HTML_PATH.read_text()
 
 GROUPABLE = ("product", "category", "region", "channel", "sales_rep", "month")
 FILTERABLE = ("product", "category", "region", "channel", "sales_rep")
 
 
+def _date(row: dict) -> str:
+    return row["date"]
+
+
 def _load() -> list[dict]:
     rows = []
     with CSV_PATH.open() as f:
@@ -70,51 +76,107 @@ def _load() -> list[dict]:
             r["revenue"] = float(r["revenue"])
             r["month"] = r["date"][:7]  # "YYYY-MM"
             rows.append(r)
+    # Keep rows in date order (a stable no-op for the shipped CSV) so date
+    # ranges can be bisected instead of scanned.
+    rows.sort(key=_date)
     return rows
 
 
+def _index(rows: list[dict]) -> dict[str, dict[str, list[dict]]]:
+    """dimension -> value -> matching rows, kept in CSV (i.e. date) order."""
+    index: dict[str, dict[str, list[dict]]] = {dim: defaultdict(list) for dim in FILTERABLE}
+    for r in rows:
+        for dim in FILTERABLE:
+            index[dim][r[dim]].append(r)
+    return {dim: dict(buckets) for dim, buckets in index.items()}
+
+
 ROWS = _load()
-DIMENSIONS = {
-    dim: sorted({r[dim] for r in ROWS}) for dim in FILTERABLE
-}
+INDEX = _index(ROWS)
+DIMENSIONS = {dim: sorted(buckets) for dim, buckets in INDEX.items()}
 DATE_MIN = min(r["date"] for r in ROWS)
 DATE_MAX = max(r["date"] for r in ROWS)
 
+# Everything get_dataset_info reports is fixed once the CSV is loaded.
+DATASET_INFO = {
+    "ok": True,
+    "company": "Voltaic Gear (mock consumer-electronics sales data)",
+    "csv": str(CSV_PATH.name),
+    "row_count": len(ROWS),
+    "date_range": {"min": DATE_MIN, "max": DATE_MAX},
+    "columns": ["order_id", "date", "product", "category", "region",
+                "channel", "sales_rep", "units", "unit_price",
+                "discount_pct", "revenue"],
+    "dimensions": {"products": DIMENSIONS["product"],
+                   "categories": DIMENSIONS["category"],
+                   "regions": DIMENSIONS["region"],
+                   "channels": DIMENSIONS["channel"],
+                   "sales_reps": DIMENSIONS["sales_rep"]},
+    "notes": "revenue = units * unit_price * (1 - discount_pct/100). "
+             "Black Friday promo week: 2025-11-24..30. "
+             "Spring Sale: 2026-04-06..19.",
+}
+
 
 def _filter(start_date: str | None = None, end_date: str | None = None,
             **dims: str | None) -> list[dict]:
-    """Filter rows by ISO date range and exact dimension matches."""
-    out = ROWS
-    if start_date:
-        out = [r for r in out if r["date"] >= start_date]
-    if end_date:
-        out = [r for r in out if r["date"] <= end_date]
-    for dim, value in dims.items():
-        if value:
-            out = [r for r in out if r[dim] == value]
+    """Filter rows by ISO date range and exact dimension matches.
+
+    Starts from the smallest matching INDEX bucket rather than scanning
+    every row, bisects the (date-sorted) bucket to the date range, then
+    applies the remaining filters to that subset.
+    """
+    wanted = {dim: value for dim, value in dims.items() if value}
+    if wanted:
+        seed = min(wanted, key=lambda d: len(INDEX[d].get(wanted[d], ())))
+        out = INDEX[seed].get(wanted.pop(seed), [])
+    else:
+        out = ROWS
+    if start_date or end_date:
+        lo = bisect_left(out, start_date, key=_date) if start_date else 0
+        hi = bisect_right(out, end_date, key=_date) if end_date else len(out)
+        out = out[lo:hi]
+    for dim, value in wanted.items():
+        out = [r for r in out if r[dim] == value]
+    return out
+
+
+def _aggregate_many(rows: list[dict], dims: tuple[str, ...]) -> dict[str, list[dict]]:
+    """Group rows by each of ``dims`` in ONE pass -> {dim: _aggregate(rows, dim)}."""
+    accs: dict[str, dict[str, list[float]]] = {
+        by: defaultdict(lambda: [0.0, 0, 0]) for by in dims
+    }
+    for r in rows:
+        revenue, units = r["revenue"], r["units"]
+        for by, acc in accs.items():
+            a = acc[r[by]]
+            a[0] += revenue
+            a[1] += units
+            a[2] += 1
+    out = {}
+    for by, acc in accs.items():
+        groups = [{by: k, "revenue": round(v[0], 2), "units": v[1], "orders": v[2]}
+                  for k, v in acc.items()]
+        key = (lambda d, by=by: d[by]) if by == "month" else (lambda d: -d["revenue"])
+        out[by] = sorted(groups, key=key)
     return out
 
 
 def _aggregate(rows: list[dict], by: str) -> list[dict]:
     """Group rows by a dimension -> revenue/units/orders, sorted by revenue."""
-    acc: dict[str, list[float]] = defaultdict(lambda: [0.0, 0, 0])
-    for r in rows:
-        a = acc[r[by]]
-        a[0] += r["revenue"]
-        a[1] += r["units"]
-        a[2] += 1
-    out = [{by: k, "revenue": round(v[0], 2), "units": v[1], "orders": v[2]}
-           for k, v in acc.items()]
-    key = (lambda d: d[by]) if by == "month" else (lambda d: -d["revenue"])
-    return sorted(out, key=key)
+    return _aggregate_many(rows, (by,))[by]
+
+
+def _invalid(name: str, value: str, valid_values: list[str]) -> dict:
+    """The one error shape every tool returns for an unrecognised argument."""
+    return {"ok": False, "error": f"unknown {name}: {value!r}",
+            "valid_values": valid_values}
 
 
 def _bad_dim(name: str, value: str | None, dim: str) -> dict | None:
     """Actionable error payload for an unknown dimension value, else None."""
-    if value and value not in DIMENSIONS[dim]:
-        return {"ok": False,
-                "error": f"unknown {name}: {value!r}",
-                "valid_values": DIMENSIONS[dim]}
+    if value and value not in INDEX[dim]:  # dict lookup, not a list scan
+        return _invalid(name, value, DIMENSIONS[dim])
     return None
 
 
@@ -146,6 +208,7 @@ def sales_dashboard(start_date: str | None = None, end_date: str | None = None,
             return err
 
     rows = _filter(start_date, end_date, region=region, category=category)
+    agg = _aggregate_many(rows, ("month", "product", "region", "category", "channel"))
     revenue = round(sum(r["revenue"] for r in rows), 2)
     units = sum(r["units"] for r in rows)
     orders = len(rows)
@@ -162,11 +225,11 @@ def sales_dashboard(start_date: str | None = None, end_date: str | None = None,
             "order_count": orders,
             "avg_order_value": round(revenue / orders, 2) if orders else 0,
         },
-        "monthly": _aggregate(rows, "month"),
-        "top_products": _aggregate(rows, "product")[:8],
-        "by_region": _aggregate(rows, "region"),
-        "by_category": _aggregate(rows, "category"),
-        "by_channel": _aggregate(rows, "channel"),
+        "monthly": agg["month"],
+        "top_products": agg["product"][:8],
+        "by_region": agg["region"],
+        "by_category": agg["category"],
+        "by_channel": agg["channel"],
         # so the app can populate its filter dropdowns
         "dimensions": {"regions": DIMENSIONS["region"],
                        "categories": DIMENSIONS["category"],
@@ -195,11 +258,9 @@ def query_sales(group_by: str, metric: str = "revenue",
         top: max number of groups to return (default 20)
     """
     if group_by not in GROUPABLE:
-        return {"ok": False, "error": f"unknown group_by: {group_by!r}",
-                "valid_values": list(GROUPABLE)}
+        return _invalid("group_by", group_by, list(GROUPABLE))
     if metric not in ("revenue", "units", "orders"):
-        return {"ok": False, "error": f"unknown metric: {metric!r}",
-                "valid_values": ["revenue", "units", "orders"]}
+        return _invalid("metric", metric, ["revenue", "units", "orders"])
     for name, value in (("product", product), ("category", category),
                         ("region", region), ("channel", channel),
                         ("sales_rep", sales_rep)):
@@ -222,24 +283,7 @@ def get_dataset_info() -> dict:
 
     Call this first to learn what filters sales_dashboard and query_sales accept.
     """
-    return {
-        "ok": True,
-        "company": "Voltaic Gear (mock consumer-electronics sales data)",
-        "csv": str(CSV_PATH.name),
-        "row_count": len(ROWS),
-        "date_range": {"min": DATE_MIN, "max": DATE_MAX},
-        "columns": ["order_id", "date", "product", "category", "region",
-                    "channel", "sales_rep", "units", "unit_price",
-                    "discount_pct", "revenue"],
-        "dimensions": {"products": DIMENSIONS["product"],
-                       "categories": DIMENSIONS["category"],
-                       "regions": DIMENSIONS["region"],
-                       "channels": DIMENSIONS["channel"],
-                       "sales_reps": DIMENSIONS["sales_rep"]},
-        "notes": "revenue = units * unit_price * (1 - discount_pct/100). "
-                 "Black Friday promo week: 2025-11-24..30. "
-                 "Spring Sale: 2026-04-06..19.",
-    }
+    return DATASET_INFO
 
 
 # ---------------------------------------------------------------------------
@@ -250,7 +294,7 @@ def get_dataset_info() -> dict:
 @mcp.resource(APP_RESOURCE_URI, mime_type="text/html;profile=mcp-app")
 def sales_dashboard_app() -> str:
     """The MCP App page for sales_dashboard (self-contained HTML)."""
-    return APP_HTML_PATH.read_text()
+    return APP_HTML
 
 
 if __name__ == "__main__":
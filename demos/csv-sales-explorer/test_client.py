@@ -60,12 +60,21 @@ async def main() -> None:
             assert "ui/initialize" in content.text, "app HTML missing the handshake"
             print(f"✅ ui resource: {content.mimeType}, {len(content.text)} chars of HTML")
 
-            # 3a. the dashboard tool
-            result = await session.call_tool(
-                "sales_dashboard",
-                {"start_date": "2025-10-01", "end_date": "2025-12-31"},
+            # 3. tool calls — independent of each other, so issue them
+            #    concurrently over the one session instead of back to back
+            dash_result, reps_result, bad_result = await asyncio.gather(
+                session.call_tool(
+                    "sales_dashboard",
+                    {"start_date": "2025-10-01", "end_date": "2025-12-31"},
+                ),
+                session.call_tool(
+                    "query_sales", {"group_by": "sales_rep", "region": "Europe", "top": 3}
+                ),
+                session.call_tool("query_sales", {"group_by": "planet"}),
             )
-            data = payload(result)
+
+            # 3a. the dashboard tool
+            data = payload(dash_result)
             assert data["ok"], data
             k = data["kpis"]
             assert k["order_count"] > 0 and len(data["monthly"]) == 3, data["filters"]
@@ -73,18 +82,14 @@ async def main() -> None:
                   f"{k['order_count']} orders, {len(data['monthly'])} months")
 
             # 3b. ad-hoc aggregation
-            result = await session.call_tool(
-                "query_sales", {"group_by": "sales_rep", "region": "Europe", "top": 3}
-            )
-            data = payload(result)
+            data = payload(reps_result)
             assert data["ok"] and data["groups"], data
             top = data["groups"][0]
             print(f"✅ query_sales: top Europe rep = {top['sales_rep']} "
                   f"(${top['revenue']:,.0f})")
 
             # 3c. actionable errors
-            result = await session.call_tool("query_sales", {"group_by": "planet"})
-            data = payload(result)
+            data = payload(bad_result)
             assert not data["ok"] and "valid_values" in data, data
             print(f"✅ error shape: {data['error']} → hints {data['valid_values'][:3]}…")
 
@@ -16,7 +16,7 @@ import asyncio
 import os
 from claude_agent_sdk import (
     ClaudeAgentOptions,
-    query,
+    ClaudeSDKClient,
     AssistantMessage,
     ResultMessage,
     TextBlock,
@@ -42,6 +42,7 @@ TOOL_LABELS = {
     "list_markdown_files": ("Scanning for markdown", CYAN),
     "extract_links":       ("Extracting links",      CYAN),
     "check_url":           ("Checking URL",           YELLOW),
+    "check_urls":          ("Checking URLs",          YELLOW),
     "write_report":        ("Writing report",         GREEN),
 }
 
@@ -54,6 +55,8 @@ def format_tool_call(block):
     if isinstance(block.input, dict):
         if "filepath" in block.input:
             detail = f" [{os.path.basename(block.input['filepath'])}]"
+        elif "urls" in block.input:
+            detail = f" [{len(block.input['urls'])} urls]"
         elif "url" in block.input:
             u = block.input["url"]
             detail = f" [{u[:60]}{'...' if len(u) > 60 else ''}]"
@@ -96,7 +99,8 @@ When the user asks to audit the course or check all links, scan both directories
 Your workflow:
 1. list_markdown_files — discover all .md files in the given directory (call once per directory)
 2. extract_links — get all URLs from each file
-3. check_url — check each unique URL (deduplicate before checking)
+3. check_urls — check all unique URLs in one batched call (deduplicate first);
+   use check_url only for a one-off re-check
 4. write_report — always write a structured report at the end
 
 Your report should include:
@@ -145,39 +149,43 @@ async def main():
     print()
     print(f"  Type {BOLD}quit{RESET} to exit\n")
 
-    while True:
-        try:
-            user_input = input(f"{BOLD}You:{RESET} ").strip()
-        except (EOFError, KeyboardInterrupt):
-            print("\nGoodbye!")
-            break
-
-        if user_input.lower() in ["quit", "exit", "q"]:
-            print("\nGoodbye!")
-            break
-
-        if not user_input:
-            continue
-
-        print()
-        async for message in query(prompt=user_input, options=options):
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        print(block.text, end="", flush=True)
-                    elif isinstance(block, ToolUseBlock):
-                        print(f"\n{format_tool_call(block)}", flush=True)
-                    elif isinstance(block, ToolResultBlock):
-                        result = format_tool_result(block)
-                        if result:
-                            print(result, flush=True)
-
-            elif isinstance(message, ResultMessage):
-                cost = message.total_cost_usd
-                turns = message.num_turns
-                print(f"\n{DIM}  ({turns} turns, ${cost:.4f}){RESET}")
-
-        print(f"\n{DIM}{'─' * 50}{RESET}\n")
+    # One client for the whole session: the CLI and the stdio MCP server are
+    # spawned once, not per question, and follow-ups keep their context.
+    async with ClaudeSDKClient(options=options) as client:
+        while True:
+            try:
+                user_input = input(f"{BOLD}You:{RESET} ").strip()
+            except (EOFError, KeyboardInterrupt):
+                print("\nGoodbye!")
+                break
+
+            if user_input.lower() in ["quit", "exit", "q"]:
+                print("\nGoodbye!")
+                break
+
+            if not user_input:
+                continue
+
+            print()
+            await client.query(user_input)
+            async for message in client.receive_response():
+                if isinstance(message, AssistantMessage):
+                    for block in message.content:
+                        if isinstance(block, TextBlock):
+                            print(block.text, end="", flush=True)
+                        elif isinstance(block, ToolUseBlock):
+                            print(f"\n{format_tool_call(block)}", flush=True)
+                        elif isinstance(block, ToolResultBlock):
+                            result = format_tool_result(block)
+                            if result:
+                                print(result, flush=True)
+
+                elif isinstance(message, ResultMessage):
+                    cost = message.total_cost_usd
+                    turns = message.num_turns
+                    print(f"\n{DIM}  ({turns} turns, ${cost:.4f}){RESET}")
+
+            print(f"\n{DIM}{'─' * 50}{RESET}\n")
 
 
 if __name__ == "__main__":
@@ -17,7 +17,9 @@ import os
 import re
 import urllib.request
 import urllib.error
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 mcp = FastMCP("link-checker")
 
@@ -74,29 +76,81 @@ def extract_links(filepath: str) -> str:
     return "\n".join(sorted(urls))
 
 
-@mcp.tool()
-def check_url(url: str) -> str:
-    """Check if a URL is reachable and return its HTTP status.
+# Recent HTTP answers per URL. Course docs repeat the same links across many
+# files and audits are re-run in one session; re-HEADing them is wasted time.
+CHECK_CACHE_TTL = 300  # seconds
+_checked: dict[str, tuple[float, str]] = {}
+_checked_lock = threading.Lock()
+
+
+def _check(url: str) -> str:
+    """_head(url) for check_urls, with working links remembered a few minutes."""
+    now = time.monotonic()
+    with _checked_lock:
+        hit = _checked.get(url)
+        if hit and now - hit[0] >= CHECK_CACHE_TTL:
+            del _checked[url]
+            hit = None
+    if hit:
+        # "200 OK (12ms)" -> "200 OK (12ms, cached)": the timing is not fresh
+        return hit[1][:-1] + ", cached)"
+    result = _head(url)
+    if result[:1] in ("2", "3"):  # only cache links that work; 429/5xx may clear
+        with _checked_lock:
+            for stale in [u for u, (t, _) in _checked.items() if now - t >= CHECK_CACHE_TTL]:
+                del _checked[stale]
+            _checked[url] = (now, result)
+    return result
+
+
+def _head(url: str) -> str:
+    """HEAD a URL and describe the result."""
+    start = time.perf_counter()  # monotonic, unlike time.time()
+
+    def elapsed_ms() -> int:
+        return int((time.perf_counter() - start) * 1000)
 
-    Args:
-        url: The URL to check
-    """
-    start = time.time()
     try:
         req = urllib.request.Request(url, method="HEAD")
         req.add_header("User-Agent", "Mozilla/5.0 (link-checker/1.0)")
         with urllib.request.urlopen(req, timeout=10) as response:
-            elapsed = int((time.time() - start) * 1000)
-            return f"{response.status} OK ({elapsed}ms)"
+            return f"{response.status} OK ({elapsed_ms()}ms)"
     except urllib.error.HTTPError as e:
-        elapsed = int((time.time() - start) * 1000)
-        return f"{e.code} {e.reason} ({elapsed}ms)"
+        return f"{e.code} {e.reason} ({elapsed_ms()}ms)"
     except urllib.error.URLError as e:
         return f"Connection error: {e.reason}"
     except Exception as e:
         return f"Error: {e}"
 
 
+@mcp.tool()
+def check_url(url: str) -> str:
+    """Check if a URL is reachable and return its HTTP status.
+
+    Args:
+        url: The URL to check
+    """
+    return _head(url)  # always live: this is the tool for re-checking a link
+
+
+@mcp.tool()
+def check_urls(urls: list[str]) -> str:
+    """Check many URLs at once, concurrently. One line per unique URL.
+
+    Prefer this over calling check_url once per link: the requests run in
+    parallel and the whole batch costs a single tool call.
+
+    Args:
+        urls: The URLs to check (duplicates are checked once)
+    """
+    unique = list(dict.fromkeys(urls))
+    if not unique:
+        return "No URLs given."
+    with ThreadPoolExecutor(max_workers=min(16, len(unique))) as pool:
+        statuses = pool.map(_check, unique)
+        return "\n".join(f"{url} -> {status}" for url, status in zip(unique, statuses))
+
+
 @mcp.tool()
 def write_report(filename: str, content: str) -> str:
     """Write a link audit report to the reports directory.
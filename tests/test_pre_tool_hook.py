@@ -3,15 +3,21 @@ from __future__ import annotations
 
 import asyncio
 
+import pytest
+
 import research_agent as ra
 
 
-def _run(coro):
-    return asyncio.get_event_loop().run_until_complete(coro) if False else asyncio.run(coro)
+@pytest.fixture(scope="module")
+def run():
+    """One event loop for the whole module instead of an asyncio.run per test."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
 
 
-def test_pre_tool_blocks_short_topic():
-    result = _run(ra.pre_tool_validate(
+def test_pre_tool_blocks_short_topic(run):
+    result = run(ra.pre_tool_validate(
         {"tool_name": "mcp__research__research_topic", "tool_input": {"topic": "a"}},
         None, None,
     ))
@@ -19,8 +25,8 @@ def test_pre_tool_blocks_short_topic():
     assert decision == "deny"
 
 
-def test_pre_tool_blocks_path_traversal_in_read_brief():
-    result = _run(ra.pre_tool_validate(
+def test_pre_tool_blocks_path_traversal_in_read_brief(run):
+    result = run(ra.pre_tool_validate(
         {"tool_name": "mcp__research__read_brief",
          "tool_input": {"brief_path": "../../secrets.txt"}},
         None, None,
@@ -29,8 +35,8 @@ def test_pre_tool_blocks_path_traversal_in_read_brief():
     assert decision == "deny"
 
 
-def test_pre_tool_blocks_absolute_path_in_read_brief():
-    result = _run(ra.pre_tool_validate(
+def test_pre_tool_blocks_absolute_path_in_read_brief(run):
+    result = run(ra.pre_tool_validate(
         {"tool_name": "mcp__research__read_brief",
          "tool_input": {"brief_path": "/etc/passwd"}},
         None, None,
@@ -39,8 +45,8 @@ def test_pre_tool_blocks_absolute_path_in_read_brief():
     assert decision == "deny"
 
 
-def test_pre_tool_allows_valid_topic():
-    result = _run(ra.pre_tool_validate(
+def test_pre_tool_allows_valid_topic(run):
+    result = run(ra.pre_tool_validate(
         {"tool_name": "mcp__research__research_topic",
          "tool_input": {"topic": "Model Context Protocol authentication"}},
         None, None,
@@ -6,9 +6,15 @@ callables directly and verify the security-relevant invariants:
   - read_brief blocks path traversal
   - the search retry returns [] instead of raising on persistent failure
   - the fetch helper rejects non-http(s) schemes
+  - the fetch helper stops reading at its byte budget
+  - repeat fetches of a URL are served from the extraction cache
 """
 from __future__ import annotations
 
+from collections import OrderedDict
+
+import httpx
+
 import research_server as rs
 
 
@@ -36,6 +42,42 @@ def test_fetch_page_rejects_non_http(monkeypatch):
     assert rs._fetch_page("ftp://example.com/x") == ""
 
 
+def test_fetch_page_stops_at_byte_budget(monkeypatch):
+    """A huge body is cut off at MAX_FETCH_BYTES rather than read in full."""
+    served = {"bytes": 0}
+
+    def body():
+        for _ in range(64):
+            chunk = b"<p>" + b"x" * 65_533 + b"</p>"
+            served["bytes"] += len(chunk)
+            yield chunk
+
+    def handler(_request):
+        return httpx.Response(200, content=body(), headers={"content-type": "text/html"})
+
+    monkeypatch.setattr(rs, "_FETCH_CACHE", OrderedDict())
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        monkeypatch.setattr(rs, "_HTTP", client)
+        text = rs._fetch_page("https://example.com/big", max_chars=100)
+    assert text == "x" * 100
+    assert served["bytes"] <= rs.MAX_FETCH_BYTES + 65_536
+
+
+def test_fetch_page_caches_extractions(monkeypatch):
+    calls = {"n": 0}
+
+    def handler(_request):
+        calls["n"] += 1
+        return httpx.Response(200, text="<p>hello</p>")
+
+    monkeypatch.setattr(rs, "_FETCH_CACHE", OrderedDict())
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        monkeypatch.setattr(rs, "_HTTP", client)
+        assert rs._fetch_page("https://example.com/a") == "hello"
+        assert rs._fetch_page("https://example.com/a") == "hello"
+    assert calls["n"] == 1
+
+
 def test_search_returns_empty_on_persistent_failure(monkeypatch):
     """When DDGS keeps raising, _search returns [] rather than crashing."""
     class BoomDDGS: